@@ -1,10 +1,18 @@
-from logbook import Logger
+from logbook import DEBUG, Logger
 
 class ControlChangeHandler:
-    def __init__(self, logger: Logger, message, templates):
+    def __init__(self, logger: Logger, templates):
         self.logger = logger
-        self.message = message
         self.template_data = templates
+        # Snapshot once; handlers are built after logging is configured
+        self._debug_enabled = logger.level <= DEBUG
+        self.message = None
         self.result: list[dict[str, any]] = [{}] # Placeholder
 
-        self.logger.debug(f"CC Handler    -> {message}")
+    def handle(self, message) -> list[dict[str, any]]:
+        """Process one Control Change message and return the result list."""
+        if self._debug_enabled:
+            self.logger.debug(f"CC Handler    -> {message}")
+        self.message = message
+        self.result = [{}]
+        return self.result
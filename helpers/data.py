@@ -1,35 +1,167 @@
+from functools import cached_property
+
 from logbook import Logger
 from helpers.json import JSONHandler
 
 
 class AppConfiguration:
+    """Application configuration backed by app_config.json.
+
+    The file is only read and parsed on first attribute access, so
+    constructing an instance is free; repeated loads of an unchanged file
+    are served from the JSONHandler module cache.
+    """
+
     def __init__(self, logger: Logger):
         self.logger = logger
-        self.raw_data = JSONHandler(
+        self._json_file = "app_config.json"
+
+    @cached_property
+    def raw_data(self) -> dict:
+        return JSONHandler(
             logger=self.logger,
-            json_file="app_config.json"
+            json_file=self._json_file
         ).json_data
 
-        self.app_options = self.raw_data["app_options"]
-        self.midi_options = self.raw_data["midi_options"]
-        self.osc_options = self.raw_data["osc_options"]
-    
+    @cached_property
+    def app_options(self) -> dict:
+        return self.raw_data["app_options"]
+
+    @cached_property
+    def midi_options(self) -> dict:
+        return self.raw_data["midi_options"]
+
+    @cached_property
+    def osc_options(self) -> dict:
+        return self.raw_data["osc_options"]
+
     def validate_config(self) -> None:
         # Not yet implemented
         pass
 
 
 class MessageTemplates:
+    """MIDI message templates backed by templates.json.
+
+    Like AppConfiguration, the file is parsed lazily on first access. The
+    byte-indexed tables are re-keyed from "0xNN" strings to plain ints at
+    load time so the handlers can look up raw MIDI bytes without
+    round-tripping them through hex strings.
+    """
+
     def __init__(self, logger: Logger):
         self.logger = logger
-        self.raw_data = JSONHandler(
+        self._json_file = "templates.json"
+
+    @cached_property
+    def raw_data(self) -> dict:
+        return JSONHandler(
             logger=self.logger,
-            json_file="templates.json"
+            json_file=self._json_file
         ).json_data
 
-        self.message_types = self.raw_data["message_types"]
-        self.sysex_templates = self.raw_data["sysex_templates"]
-        self.console_types = self.raw_data["console_types"]
-        self.mmc_commands = self.raw_data["mmc_commands"]
-        self.channel_definitions = self.raw_data["channel_definitions"]
-        self.mix_pan_definitions = self.raw_data["mix_pan_definitions"]
+    @cached_property
+    def message_types(self) -> dict[int, dict]:
+        # Keyed by the status byte's high nibble as an int; subtype tables
+        # (controller numbers) are likewise re-keyed from hex strings
+        converted = {}
+        for nibble, info in self.raw_data["message_types"].items():
+            info = dict(info)
+            if isinstance(info.get("subtype"), dict):
+                info["subtype"] = {
+                    int(subtype, 16): length
+                    for subtype, length in info["subtype"].items()
+                }
+            converted[int(nibble, 16)] = info
+        return converted
+
+    @cached_property
+    def length_table(self) -> list[int]:
+        # Expected message length indexed by the full status byte, each
+        # nibble entry expanded across its 16 channels: 0 means unknown,
+        # -1 means the length depends on the controller byte (see
+        # subtype_lengths)
+        table = [0] * 256
+        for nibble, info in self.message_types.items():
+            length = info.get("length")
+            if not isinstance(length, int) or length <= 0:
+                length = -1 if isinstance(info.get("subtype"), dict) else 0
+            for status in range(nibble << 4, (nibble << 4) + 16):
+                table[status] = length
+        return table
+
+    @cached_property
+    def subtype_lengths(self) -> dict[tuple[int, int], int]:
+        # (status high nibble, controller byte) -> expected length, for
+        # the length_table entries marked -1
+        return {
+            (nibble, subtype): length
+            for nibble, info in self.message_types.items()
+            if isinstance(info.get("subtype"), dict)
+            for subtype, length in info["subtype"].items()
+        }
+
+    @cached_property
+    def sysex_templates(self) -> dict[str, list[int]]:
+        return {
+            name: [int(byte, 16) for byte in template]
+            for name, template in self.raw_data["sysex_templates"].items()
+        }
+
+    @cached_property
+    def sysex_header(self) -> list[int]:
+        # Kept as a list so it compares directly against message slices
+        return self.sysex_templates.get("sysex_header", [])
+
+    @cached_property
+    def sysex_header_len(self) -> int:
+        return len(self.sysex_header)
+
+    @cached_property
+    def sysex_header_bytes(self) -> bytes:
+        # For bytes.startswith header detection on the message itself
+        return bytes(self.sysex_header)
+
+    @cached_property
+    def console_types(self) -> dict[int, str]:
+        return self._int_keyed(self.raw_data["console_types"])
+
+    @cached_property
+    def mmc_commands(self) -> dict[int, str]:
+        return self._int_keyed(self.raw_data["mmc_commands"])
+
+    @cached_property
+    def channel_definitions(self) -> dict[int, str]:
+        return self._int_keyed(self.raw_data["channel_definitions"])
+
+    @cached_property
+    def mix_pan_definitions(self) -> dict[int, str]:
+        return self._int_keyed(self.raw_data["mix_pan_definitions"])
+
+    # Densely-indexed variants of the per-byte tables: a 256-entry list
+    # lookup is cheaper than hashing a dict key on every message
+
+    @cached_property
+    def console_types_table(self) -> list[str | None]:
+        return self._dense_table(self.console_types)
+
+    @cached_property
+    def channel_definitions_table(self) -> list[str | None]:
+        return self._dense_table(self.channel_definitions)
+
+    @cached_property
+    def mmc_commands_table(self) -> list[str | None]:
+        return self._dense_table(self.mmc_commands)
+
+    @staticmethod
+    def _int_keyed(table: dict[str, str]) -> dict[int, str]:
+        """Convert a dict keyed on "0xNN" hex strings to one keyed on ints."""
+        return {int(key, 16): value for key, value in table.items()}
+
+    @staticmethod
+    def _dense_table(table: dict[int, str]) -> list[str | None]:
+        """Expand an int-keyed dict into a 256-entry list indexed by byte value."""
+        dense = [None] * 256
+        for key, value in table.items():
+            dense[key] = value
+        return dense
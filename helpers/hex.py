@@ -1,6 +1,9 @@
-from collections import deque
+# MIDI bytes are always 0-255, so every possible hex string can be built
+# once at import time and looked up instead of formatted per byte
+_HEX_TABLE = tuple(f"0x{i:02x}" for i in range(256))
 
-def hexify(message_data: list[int]) -> deque[str]:
+
+def hexify(message_data: list[int]) -> list[str]:
     """Convert a list of decimal values to a list of hexadecimal values
 
     Args:
@@ -9,10 +12,7 @@ def hexify(message_data: list[int]) -> deque[str]:
     Returns:
         list: A hexadecimal-formatted message
     """
-    hex_message = deque(maxlen=15000)
-    for item in message_data:
-        hex_message.extend([to_padded_hex(item)])
-    return hex_message
+    return [_HEX_TABLE[item] for item in message_data]
 
 def to_padded_hex(integer: int, desired_len: int = 2) -> str:
     """Convert an integer to a zero-padded hexadecimal string.
@@ -24,4 +24,8 @@ def to_padded_hex(integer: int, desired_len: int = 2) -> str:
     Returns:
         str: The formatted hexadecimal string with '0x' prefix.
     """
-    return f"0x{integer:0{desired_len}x}"
\ No newline at end of file
+    # Every real call site formats a single byte at the default width, which
+    # the precomputed table answers without any f-string machinery
+    if desired_len == 2 and 0 <= integer < 256:
+        return _HEX_TABLE[integer]
+    return f"0x{integer:0{desired_len}x}"
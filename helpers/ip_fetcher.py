@@ -1,28 +1,49 @@
 import socket
+import time
+
 import psutil
 
+# Prefixes to exclude, as tuples so str.startswith can take them natively
+_EXCLUDE_V4 = ('127.', '169.254')
+_EXCLUDE_V6 = ('::1', 'fe80::')
+
+
 class IPFetcher:
-    def __init__(self):
-        # Patterns to exclude for IPv4 and IPv6 addresses
-        self.exclude_ipv4_patterns = ['127.', '169.254']
-        self.exclude_ipv6_patterns = ['::1', 'fe80::']
+    # Interface enumeration is expensive on some platforms (notably Windows),
+    # so the psutil snapshot is cached at class level and shared by instances
+    _cached_addrs = None
+    _cached_at = 0.0
+
+    @classmethod
+    def _enumerate(cls, max_age: float = 30.0):
+        """Return psutil.net_if_addrs(), re-enumerating at most every max_age seconds."""
+        now = time.monotonic()
+        if cls._cached_addrs is None or (now - cls._cached_at) >= max_age:
+            cls._cached_addrs = psutil.net_if_addrs()
+            cls._cached_at = now
+        return cls._cached_addrs
+
+    @classmethod
+    def refresh(cls):
+        """Drop the cached interface snapshot so the next call re-enumerates."""
+        cls._cached_addrs = None
 
     def _is_valid_ipv4(self, address):
         """Check if the IPv4 address is valid (not loopback or link-local)."""
-        return not any(address.startswith(pattern) for pattern in self.exclude_ipv4_patterns)
+        return not address.startswith(_EXCLUDE_V4)
 
     def _is_valid_ipv6(self, address):
         """Check if the IPv6 address is valid (not loopback or link-local)."""
-        return not any(address.startswith(pattern) for pattern in self.exclude_ipv6_patterns)
+        return not address.startswith(_EXCLUDE_V6)
 
     def get_interface_ips(self):
         """Get all valid IP addresses grouped by interface and type (IPv4, IPv6)."""
         ip_addresses = {}
 
         # Iterate over all network interfaces
-        for interface, addrs in psutil.net_if_addrs().items():
+        for interface, addrs in self._enumerate().items():
             ip_list = {'ipv4': [], 'ipv6': []}
-            
+
             for addr in addrs:
                 match addr.family:
                     # Handle IPv4 addresses (AF_INET)
@@ -41,22 +62,40 @@ class IPFetcher:
 
         return ip_addresses
 
-    def get_raw_ips(self):
+    def get_raw_ips(self, packed=False):
         """
         Get all valid IP addresses (both IPv4 and IPv6) as a flat list,
         ignoring interfaces and IP types.
+
+        Args:
+            packed (bool): When True, return inet_pton-packed bytes instead
+                           of strings (the form zeroconf uses internally).
         """
-        ips = self.get_interface_ips()
         raw_ips = []
 
-        # Collect all valid IPs (both IPv4 and IPv6) into a flat list
-        for _, addresses in ips.items():
-            raw_ips.extend(addresses['ipv4'])
-            raw_ips.extend(addresses['ipv6'])
+        # Walk the interfaces exactly once, appending straight to the flat
+        # list rather than building the per-interface grouping first
+        for addrs in self._enumerate().values():
+            for addr in addrs:
+                family = addr.family
+                if family == socket.AF_INET:
+                    if not addr.address.startswith(_EXCLUDE_V4):
+                        raw_ips.append(
+                            socket.inet_pton(family, addr.address) if packed else addr.address
+                        )
+                elif family == socket.AF_INET6:
+                    if not addr.address.startswith(_EXCLUDE_V6):
+                        raw_ips.append(
+                            socket.inet_pton(family, addr.address) if packed else addr.address
+                        )
 
         return raw_ips
 
 
+# Shared instance so callers don't construct a fresh fetcher per lookup
+shared_fetcher = IPFetcher()
+
+
 # Example Usage
 if __name__ == "__main__":
     ip_fetcher = IPFetcher()
@@ -1,36 +1,58 @@
 """
 JSON File Handler
 
-This module provides a utility function for reading JSON files safely,
+This module provides a utility class for reading JSON files safely,
 handling errors gracefully, and logging relevant information.
 
-Functions:
-    read_json(file_name: str, app_logger: Logger, encoding: str = "utf-8") -> Dict[str, Any]
-        Reads a JSON file and returns its content as a dictionary.
+Parsed files are cached at module level keyed on (absolute path, mtime),
+so re-instantiating a handler for an unchanged file skips the disk read
+and parse entirely. Callers must treat the returned data as read-only,
+since cache hits return the same object.
 """
-import asyncio
 import json
+import os
 
-import aiofiles
 from logbook import Logger
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+# Cache of parsed JSON keyed on (absolute path, mtime)
+_JSON_CACHE: dict[tuple[str, float], dict] = {}
+
 
 class JSONHandler:
     def __init__(self, logger: Logger, json_file=None, encoding="utf-8"):
         self.logger = logger
         self.file_name = json_file
         self.encoding = encoding
-        self.json_data = asyncio.run(self.read_json())
+        self.json_data = self.read_json()
 
-    async def read_json(self) -> dict[str, any]:
-        self.logger.debug(f"Attempting to read JSON file: '{self.file_name}'")
+    def read_json(self) -> dict[str, any]:
+        abs_path = os.path.abspath(self.file_name)
         try:
-            async with aiofiles.open(self.file_name, "r", encoding=self.encoding) as json_file:
-                data = await json_file.read()
-                return json.loads(data)
+            cache_key = (abs_path, os.stat(abs_path).st_mtime)
         except FileNotFoundError as e:
             self.logger.error(f"JSON file not found: {self.file_name}")
             raise e
-        except json.JSONDecodeError as e:
+
+        cached = _JSON_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        self.logger.debug(f"Attempting to read JSON file: '{self.file_name}'")
+        try:
+            with open(abs_path, "rb") as json_file:
+                # orjson takes the raw bytes directly, skipping the utf-8
+                # decode step stdlib json would perform
+                data = _loads(json_file.read())
+        except ValueError as e:  # covers json and orjson JSONDecodeError
             self.logger.error(f"Invalid JSON format in file '{self.file_name}': {e}")
             raise e
+
+        _JSON_CACHE[cache_key] = data
+        return data
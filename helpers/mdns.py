@@ -1,9 +1,8 @@
-import asyncio
 import threading
 
 from logbook import Logger
 from zeroconf import IPVersion, ServiceInfo, Zeroconf
-from helpers.ip_fetcher import IPFetcher
+from helpers.ip_fetcher import shared_fetcher
 
 
 class ZeroConfService:
@@ -20,7 +19,9 @@ class ZeroConfService:
             svc_ipver     (str): IP Version to use for the Zeroconf Service
         """
         self.logger = app_logger
-        self.ip_addresses = IPFetcher().get_raw_ips()
+        # Pass the addresses pre-packed so zeroconf skips re-parsing the
+        # strings with inet_pton on every advertisement
+        self.ip_addresses = shared_fetcher.get_raw_ips(packed=True)
 
         self.svc_port = svc_port
         self.svc_name = svc_name
@@ -36,7 +37,7 @@ class ZeroConfService:
         self.register_service()
 
         self.exit_event = threading.Event()
-        self.thread = threading.Thread(target=self.run_service_worker, daemon=True)
+        self.thread = threading.Thread(target=self.service_worker, daemon=True)
         self.thread.start()
 
     def get_ip_ver(self, ip_ver) -> IPVersion | None:
@@ -57,15 +58,10 @@ class ZeroConfService:
             case _:
                 return None
 
-    def run_service_worker(self) -> None:
-        """Run the service worker in an asyncio event loop in a separate thread"""
-        asyncio.run(self.service_worker())
-
-    async def service_worker(self) -> None:
-        """Async service worker that registers the service and keeps it alive"""
+    def service_worker(self) -> None:
+        """Park until shutdown is signalled, then unregister the service"""
         try:
-            while not self.exit_event.is_set():
-                await asyncio.sleep(0.1)
+            self.exit_event.wait()
         finally:
             self.unregister_service()
 
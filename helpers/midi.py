@@ -1,17 +1,32 @@
+import os
+import threading
+from collections import deque
+
 import rtmidi
 
-from logbook import Logger
+from logbook import DEBUG, Logger
 from helpers.cc import ControlChangeHandler
 from helpers.sysex import SysExHandler
 from helpers.nrpn import NRPNHandler
 
 class MIDIInterface:
-    def __init__(self, app_logger: Logger, input_name: str, queue_size_limit: int = 1024,
-                 sysex_disable: bool = False):
+    # rtmidi's internal queue is only used when no callback is installed; it
+    # is drop-newest on overflow, so a large limit just buffers stale events
+    # and adds latency. With the callback path active our own drop-oldest
+    # deque is the real buffer, so keep this small.
+    def __init__(self, app_logger: Logger, input_name: str, queue_size_limit: int = 64,
+                 sysex_disable: bool = False, on_message=None):
         self.logger = app_logger
         self.input_name = input_name
         self.queue_size_limit = queue_size_limit
         self.sysex_disable = sysex_disable
+        self.on_message = on_message
+
+        # Bounded buffer between the rtmidi callback thread and our consumer;
+        # deque.append is atomic in CPython and drops oldest under overload.
+        # The event wakes the consumer so it never has to poll
+        self._queue = deque(maxlen=1024)
+        self._queue_event = threading.Event()
 
         # Placeholder values
         self.midi_instance = None
@@ -26,16 +41,21 @@ class MIDIInterface:
         except Exception as e:
             self.logger.error(f"Failed to initialize MIDI input: {e}")
 
-        # List available MIDI Ports for debugging
-        available_ports = self.midi_instance.get_ports()
-        self.logger.debug("Available MIDI ports:")
-        for port in available_ports:
-            self.logger.debug(f" --> {port}")
+        # Enumerate the MIDI ports once, finding the requested port in the
+        # same pass; get_ports() queries the OS MIDI subsystem each call, so
+        # the result is kept for later reference
+        self.available_ports = self.midi_instance.get_ports()
+        if self.logger.level <= DEBUG:
+            self.logger.debug("Available MIDI ports:")
+            for port in self.available_ports:
+                self.logger.debug(f" --> {port}")
 
-        if not available_ports:
+        if not self.available_ports:
             self.logger.error("No available MIDI input ports")
-        if self.input_name in available_ports:
-            port_index = available_ports.index(input_name)
+        for index, port in enumerate(self.available_ports):
+            if port == self.input_name:
+                port_index = index
+                break
         else:
             self.logger.error(f"MIDI port '{input_name}' was not found in available ports")
 
@@ -47,35 +67,78 @@ class MIDIInterface:
             self.logger.error(f"Failed to open MIDI port '{self.input_name}': {e}")
             raise ConnectionError from e
 
+        # Keep the rtmidi callback down to a single enqueue and do all
+        # processing on a dedicated thread, so Python-side work never adds
+        # jitter to MIDI input
+        if self.on_message is not None:
+            self.midi_instance.set_callback(self._enqueue)
+            self._consumer = threading.Thread(target=self._consume, daemon=True)
+            self._consumer.start()
+
+    def _enqueue(self, event, data=None) -> None:
+        """rtmidi callback: push the (message, delta-time) event and return."""
+        self._queue.append(event)
+        self._queue_event.set()
+
+    def _consume(self) -> None:
+        """Drain the queue and hand each event to the registered callback."""
+        # Best effort: real-time scheduling keeps processing latency steady
+        # when the host is busy. Needs CAP_SYS_NICE, so failing here is
+        # normal and the thread just runs at default priority
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(1))
+        except (AttributeError, OSError):
+            self.logger.debug("Could not enable real-time scheduling for the MIDI consumer")
+
+        pop = self._queue.popleft
+        handle = self.on_message
+        wait = self._queue_event.wait
+        clear = self._queue_event.clear
+        while True:
+            try:
+                event = pop()
+            except IndexError:
+                # Sleep until the producer signals; clear first so a set
+                # that races in after the drain is not lost
+                clear()
+                if self._queue:
+                    continue
+                wait()
+                continue
+            handle(event, None)
+
 
 class MIDIProcessor:
-    def __init__(self, logger: Logger, message: tuple, data, templates):
+    def __init__(self, logger: Logger, templates):
         self.logger = logger
         self.templates = templates
-        self.message = message
-        self.data = data
-        self.result = [{}]
-
-        self.process()
-
-    def process(self) -> None:
-        message_type = self.message[0]
-        dispatch_map = {
-            "0xf0": SysExHandler,
-            "0xb": NRPNHandler,
-            "0x9": ControlChangeHandler
-        }
-        if message_type in dispatch_map:
-            self.result = dispatch_map[message_type](
-                self.logger,
-                list(self.message),
-                self.templates
-            ).result
-        elif message_type[:3] in dispatch_map:
-            self.result = dispatch_map[message_type[:3]](
-                self.logger,
-                list(self.message),
-                self.templates
-            ).result
-        else:
-            self.logger.warning(f"Message type not implemented -> {message_type}")
+
+        # Handler instances are created once and reused for every message,
+        # indexed by the status byte's high nibble; one shift and one tuple
+        # index per message instead of dict lookups on hex strings
+        self._dispatch = (
+            None, None, None, None, None, None, None, None,
+            None,                                        # 0x8 Note Off
+            ControlChangeHandler(logger, templates),     # 0x9 Note On
+            None,                                        # 0xA
+            NRPNHandler(logger, templates),              # 0xB Control Change / NRPN
+            None, None, None,
+            SysExHandler(logger, templates)              # 0xF System (0xF0 SysEx)
+        )
+
+    def process(self, message) -> list[dict[str, any]]:
+        """Dispatch one complete MIDI message and return the handler result."""
+        # The message is raw int bytes end-to-end; snapshot the accumulation
+        # buffer into an immutable bytes object the handlers can index and
+        # prefix-compare at C level
+        message = bytes(message)
+        status = message[0]
+        handler = self._dispatch[status >> 4]
+        # Only 0xF0 carries a SysEx payload; other system messages (0xF1+)
+        # are not handled
+        if status > 0xF0:
+            handler = None
+        if handler is None:
+            self.logger.warning(f"Message type not implemented -> {status:#04x}")
+            return [{}]
+        return handler.handle(message)
@@ -1,75 +1,82 @@
-from logbook import Logger
+from logbook import DEBUG, Logger
 
 class NRPNHandler:
-    def __init__(self, logger: Logger, message, templates):
+    def __init__(self, logger: Logger, templates):
         self.logger = logger
-        self.message = message
         self.template_data = templates
+        # Snapshot once; handlers are built after logging is configured
+        self._debug_enabled = logger.level <= DEBUG
+        self.message = None
         self.result: list[dict[str, any]] = [{}] # Placeholder
-        
-        self.logger.debug(f"NRPN Handler  -> {message}")
-        self.handle_parameter(self.message[5])
+
+    def handle(self, message) -> list[dict[str, any]]:
+        """Process one NRPN message and return the result list."""
+        if self._debug_enabled:
+            self.logger.debug(f"NRPN Handler  -> {message}")
+        self.message = message
+        self.result = [{}]
+        self.handle_parameter(message[5])
+        return self.result
 
     def handle_parameter(self, parameter) -> None:
         parameter_map = {
-            "0x12": self.get_ch_usb_source,
-            "0x16": self.get_pan_position,
-            "0x17": self.get_fader_position,
-            "0x51": self.get_pafl_select,
-            "0x57": self.get_ch_preamp_source,
+            0x12: self.get_ch_usb_source,
+            0x16: self.get_pan_position,
+            0x17: self.get_fader_position,
+            0x51: self.get_pafl_select,
+            0x57: self.get_ch_preamp_source,
         }
         if parameter in parameter_map:
             parameter_map[parameter]()
-    
+
     def get_fader_position(self):
         ch_number = self.message[2]
         self.result = [{
             "result_type": "channel_fader",
-            "channel": self.template_data.channel_definitions.get(ch_number, "Unknown"),
+            "channel": self.template_data.channel_definitions_table[ch_number] or "Unknown",
             "data": "placeholder"
         }]
 
     def get_pan_position(self):
         ch_number = self.message[2]
-        pan_position = int(self.message[8], 16) - 37
+        pan_position = self.message[8] - 37
         mix = self.message[11]
         self.result = [{
             "result_type": "channel_pan",
-            "channel": self.template_data.channel_definitions.get(ch_number, "Unknown"),
+            "channel": self.template_data.channel_definitions_table[ch_number] or "Unknown",
             "mix": self.template_data.mix_pan_definitions.get(mix, "Unknown"),
             "data": pan_position
         }]
-    
+
     def get_pafl_select(self):
         ch_number = self.message[2]
-        pafl_selected = bool(int(self.message[8], 16))
+        pafl_selected = bool(self.message[8])
         self.result = [{
             "result_type": "pafl_select",
-            "channel": self.template_data.channel_definitions.get(ch_number, "Unknown"),
+            "channel": self.template_data.channel_definitions_table[ch_number] or "Unknown",
             "data": pafl_selected
         }]
 
     def get_ch_preamp_source(self):
         ch_number = self.message[2]
         source_map = {
-            "0x00": "local",
-            "0x01": "dsnake"
+            0x00: "local",
+            0x01: "dsnake"
         }
         self.result = [{
             "result_type": "ch_preamp_source",
-            "channel": self.template_data.channel_definitions.get(ch_number, "Unknown"),
+            "channel": self.template_data.channel_definitions_table[ch_number] or "Unknown",
             "data": source_map.get(self.message[8], "Unknown")
         }]
 
     def get_ch_usb_source(self):
         ch_number = self.message[2]
         source_map = {
-            "0x00": "preamp",
-            "0x01": "usb"
+            0x00: "preamp",
+            0x01: "usb"
         }
         self.result = [{
             "result_type": "ch_usb_source",
-            "channel": self.template_data.channel_definitions.get(ch_number, "Unknown"),
+            "channel": self.template_data.channel_definitions_table[ch_number] or "Unknown",
             "data": source_map.get(self.message[8], "Unknown")
         }]
-
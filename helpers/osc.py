@@ -1,6 +1,54 @@
-from concurrent.futures import ThreadPoolExecutor
-from logbook import Logger
-from pythonosc import udp_client
+import ctypes
+import socket
+import sys
+
+from logbook import DEBUG, Logger
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+# sendmmsg(2) submits a vector of datagrams in one syscall; it only exists
+# on Linux, so bind it lazily and fall back to per-target sendto elsewhere
+_libc = None
+if sys.platform.startswith("linux"):
+    try:
+        _libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        _libc.sendmmsg
+    except (OSError, AttributeError):
+        _libc = None
+
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class _SockAddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),
+        ("sin_addr", ctypes.c_ubyte * 4),
+        ("sin_zero", ctypes.c_char * 8),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IoVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", _MsgHdr),
+        ("msg_len", ctypes.c_uint),
+    ]
 
 
 class OSCClient:
@@ -13,8 +61,22 @@ class OSCClient:
             app_logger (Logger): Logger instance for debugging and error reporting.
         """
         self.logger = app_logger
-        self.targets: dict[str, udp_client.SimpleUDPClient] = {}
-        self.executor = ThreadPoolExecutor(max_workers=5)  # Limit to 5 concurrent threads
+        self._debug_enabled = app_logger.level <= DEBUG
+        self.targets: dict[str, tuple[str, int]] = {}
+        # Packed sockaddr_in per target (None when the address is not a
+        # plain IPv4 literal), used for the sendmmsg fast path
+        self._sockaddrs: dict[str, _SockAddrIn | None] = {}
+        # Frozen (name, addr, sockaddr) view of the targets, rebuilt on
+        # registration so the send loop never allocates a dict view
+        self._targets_snapshot: tuple[tuple[str, tuple[str, int], _SockAddrIn | None], ...] = ()
+        # One unconnected datagram socket shared by all targets; sendto is a
+        # single non-blocking syscall, so there is nothing to parallelize
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.setblocking(False)
+        # One builder reused for every message; reset between builds rather
+        # than allocated per send. Sends all happen on the MIDI consumer
+        # thread, so no lock is needed
+        self._builder = OscMessageBuilder(address="/")
 
     def add_targets(self, targets: list[dict[str, any]]):
         self.logger.debug("Adding OSC targets...")
@@ -42,11 +104,43 @@ class OSCClient:
         if target_name in self.targets:
             self.logger.warning(f"Target '{target_name}' is already registered. Overwriting...")
 
-        self.targets[target_name] = udp_client.SimpleUDPClient(address, port)
+        # Resolve hostnames once here rather than on every send; sendto
+        # re-resolves non-literal addresses per call, which puts DNS on the
+        # hot path. A target that does not resolve now would just fail on
+        # every send, so it is not registered at all
+        try:
+            address = socket.gethostbyname(address)
+        except OSError as e:
+            self.logger.error(f"Could not resolve '{address}' for target '{target_name}', target not registered -> {e}")
+            return
+
+        self.targets[target_name] = (address, port)
+        self._sockaddrs[target_name] = self._pack_sockaddr(address, port)
+        self._targets_snapshot = tuple(
+            (name, addr, self._sockaddrs[name])
+            for name, addr in self.targets.items()
+        )
         self.logger.debug(f" --> Added OSC target: '{target_name}' ({address}:{port})")
 
+    @staticmethod
+    def _pack_sockaddr(address: str, port: int) -> _SockAddrIn | None:
+        """Pack an IPv4 literal into a sockaddr_in, or None for hostnames."""
+        try:
+            packed_ip = socket.inet_aton(address)
+        except OSError:
+            return None
+        sockaddr = _SockAddrIn()
+        sockaddr.sin_family = socket.AF_INET
+        sockaddr.sin_port = socket.htons(port)
+        ctypes.memmove(sockaddr.sin_addr, packed_ip, 4)
+        return sockaddr
+
     def send(self, path: str, value: any = None) -> None:
-        """Send an OSC message to all registered targets in parallel.
+        """Send an OSC message to all registered targets.
+
+        The message is serialized to its wire format once and the same
+        datagram is sent to every target; on Linux all targets are
+        submitted with a single sendmmsg syscall.
 
         Args:
             path (str): The OSC address pattern (must start with '/').
@@ -55,24 +149,82 @@ class OSCClient:
         Raises:
             ValueError: If the OSC path is invalid.
         """
+        self.send_many([(path, value)])
 
-        if not isinstance(path, str) or not path.startswith("/"):
-            raise ValueError(f"Invalid OSC path: '{path}'. Must be a string starting with '/'.")
+    def send_many(self, messages: list[tuple[str, any]]) -> None:
+        """Send several OSC messages to all registered targets at once.
 
-        if not self.targets:
+        Amortizes serialization and (on Linux) syscall cost when a single
+        MIDI event produces multiple OSC messages.
+
+        Args:
+            messages: A list of (path, value) pairs.
+
+        Raises:
+            ValueError: If any OSC path is invalid.
+        """
+        if not self._targets_snapshot:
             self.logger.warning("No OSC targets registered. Message not sent.")
             return
 
-        def send_message(target_name: str, client: udp_client.SimpleUDPClient):
-            """Send message to a specific target."""
+        dgrams = [self._build_dgram(path, value) for path, value in messages]
+
+        batch = []  # (dgram, sockaddr) pairs eligible for sendmmsg
+        for target_name, addr, sockaddr in self._targets_snapshot:
+            for (path, value), dgram in zip(messages, dgrams):
+                if _libc is not None and sockaddr is not None:
+                    batch.append((dgram, sockaddr))
+                else:
+                    # Contain per-destination failures so one bad target
+                    # cannot block delivery to the others
+                    try:
+                        self._sock.sendto(dgram, addr)
+                    except OSError as e:
+                        self.logger.error(f"Error sending to '{target_name}': {e}")
+                        continue
+                if self._debug_enabled:
+                    self.logger.debug(f"Sent to '{target_name}' - Path: {path}, Value: {value}")
+
+        # The batch shares one socket and one syscall, so failures here are
+        # socket-wide; flush it regardless of any sendto errors above
+        if batch:
             try:
-                client.send_message(path, value)
-                self.logger.debug(f"Sent to '{target_name}' - Path: {path}, Value: {value}")
-            except Exception as e:
-                self.logger.error(f"Error sending to '{target_name}': {e}")
-
-        futures = [self.executor.submit(send_message, name, client) for name, client in self.targets.items()]
-        
-        for future in futures:
-            future.result()  # Ensures all messages are sent before returning
-        return
+                self._sendmmsg(batch)
+            except OSError as e:
+                self.logger.error(f"Batched OSC send failed: {e}")
+
+    def close(self) -> None:
+        """Release the shared socket; the client cannot send afterwards."""
+        self._sock.close()
+
+    def _build_dgram(self, path: str, value: any) -> bytes:
+        """Serialize one (path, value) pair to its OSC wire format."""
+        if not isinstance(path, str) or not path.startswith("/"):
+            raise ValueError(f"Invalid OSC path: '{path}'. Must be a string starting with '/'.")
+        builder = self._builder
+        builder.address = path
+        builder._args.clear()
+        if value is not None:
+            builder.add_arg(value)
+        return builder.build().dgram
+
+    def _sendmmsg(self, batch: list[tuple[bytes, _SockAddrIn]]) -> None:
+        """Submit all (dgram, sockaddr) pairs with a single sendmmsg syscall."""
+        count = len(batch)
+        iovecs = (_IoVec * count)()
+        headers = (_MMsgHdr * count)()
+        buffers = []  # keep the payload buffers alive until the syscall returns
+
+        for i, (dgram, sockaddr) in enumerate(batch):
+            buffer = ctypes.create_string_buffer(dgram, len(dgram))
+            buffers.append(buffer)
+            iovecs[i].iov_base = ctypes.cast(buffer, ctypes.c_void_p)
+            iovecs[i].iov_len = len(dgram)
+            headers[i].msg_hdr.msg_name = ctypes.cast(ctypes.pointer(sockaddr), ctypes.c_void_p)
+            headers[i].msg_hdr.msg_namelen = ctypes.sizeof(sockaddr)
+            headers[i].msg_hdr.msg_iov = ctypes.pointer(iovecs[i])
+            headers[i].msg_hdr.msg_iovlen = 1
+
+        sent = _libc.sendmmsg(self._sock.fileno(), headers, count, 0)
+        if sent < 0:
+            raise OSError(ctypes.get_errno(), "sendmmsg failed")
@@ -1,24 +1,49 @@
-from logbook import Logger
+from functools import lru_cache
+
+from logbook import DEBUG, Logger
 
 class SysExHandler:
-    def __init__(self, logger: Logger, message, templates):
+    # Action byte to handler-method name; built once at class creation so
+    # dispatch allocates no dict or bound methods per message
+    _ACTIONS = {
+        0x02: "get_channel_name",
+        0x11: "get_console_info",
+        0x13: "get_meter_data",
+        0x14: "handle_end_of_sync",
+        0x7F: "handle_mmc_action"
+    }
+
+    def __init__(self, logger: Logger, templates):
         self.logger = logger
-        self.message = message
         self.template_data = templates
+        # Snapshot once; handlers are built after logging is configured
+        self._debug_enabled = logger.level <= DEBUG
+        self.message = None
         self.result: list[dict[str, any]] = [{}] # Placeholder
-        
-        self.logger.debug(f"SysEx Handler -> {message}")
+        # Resolve the action methods to bound callables once, so dispatch
+        # is a single dict lookup and call per message with no getattr
+        self._actions = {
+            action: getattr(self, name) for action, name in self._ACTIONS.items()
+        }
+
+    def handle(self, message) -> list[dict[str, any]]:
+        """Process one SysEx message and return the result list."""
+        if self._debug_enabled:
+            self.logger.debug(f"SysEx Handler -> {message}")
+        self.message = message
+        self.result = [{}]
 
-        self.action, self.msg_data = self.split_message(self.message)
-        if self.action and self.msg_data:
+        self.action, self.msg_data = self.split_message(message)
+        if self.action is not None and self.msg_data:
             self.handle_action(self.action)
+        return self.result
 
     def split_message(self, message):
         """
         Extracts the action and data from a SysEx message.
 
         Args:
-            message (list): The full SysEx message as a list of hex values.
+            message (bytes): The full SysEx message as raw bytes.
 
         Returns:
             tuple: (action, data) extracted from the message.
@@ -27,12 +52,10 @@ class SysExHandler:
             self.logger.error("Invalid SysEx message: Too short")
             return None, None
 
-        sysex_header = self.template_data.sysex_templates.get("sysex_header", [])
-        header_len = len(sysex_header)
-
-        if message[:header_len] == sysex_header:
-            # Message contains a valid header
-            extracted_data = message[header_len:-1]  # Strip header and end byte
+        if message.startswith(self.template_data.sysex_header_bytes):
+            # Message contains a valid header; startswith compares in C
+            # without allocating a slice
+            extracted_data = message[self.template_data.sysex_header_len:-1]  # Strip header and end byte
         else:
             # Assume message has no specific header
             extracted_data = message[1:-1]  # Strip start and end byte
@@ -48,38 +71,45 @@ class SysExHandler:
 
 
     def handle_action(self, action) -> None:
-        action_map = {
-            "0x02": self.get_channel_name,
-            "0x11": self.get_console_info,
-            "0x13": self.get_meter_data,
-            "0x14": self.handle_end_of_sync,
-            "0x7f": self.handle_mmc_action
-        }
-        if action in action_map:
-            action_map[action]()
+        method = self._actions.get(action)
+        if method is not None:
+            method()
+
+    # Console polls and sync echoes repeat the same payload bytes verbatim,
+    # so the parsed results are memoized on the payload. The handler is a
+    # process-lifetime singleton, which makes caching on the bound method
+    # safe, and the cached lists are never mutated downstream
 
     def get_console_info(self):
         if len(self.msg_data) == 3:
-            box_id, ver_maj, ver_min = self.msg_data
-            console_type = self.template_data.console_types.get(box_id, "Unknown")
-            self.result =  [
-                {
-                    "result_type": "console_type",
-                    "data": console_type
-                },
-                {
-                    "result_type": "console_fwversion",
-                    "data": f"{int(ver_maj, 16)}.{int(ver_min, 16)}"
-                }]
+            self.result = self._parse_console_info(self.msg_data)
         else:
             self.logger.error("Console Information message is malformed.")
 
+    @lru_cache(maxsize=512)
+    def _parse_console_info(self, msg_data: bytes) -> list[dict[str, any]]:
+        box_id, ver_maj, ver_min = msg_data
+        console_type = self.template_data.console_types_table[box_id] or "Unknown"
+        return [
+            {
+                "result_type": "console_type",
+                "data": console_type
+            },
+            {
+                "result_type": "console_fwversion",
+                "data": f"{ver_maj}.{ver_min}"
+            }]
+
     def get_channel_name(self):
-        ch_number, ch_name_array = self.msg_data[0], self.msg_data[1:]
-        ch_name_str = "".join(bytearray.fromhex(item[2:]).decode() for item in ch_name_array).rstrip('\x00')
-        self.result = [{
+        self.result = self._parse_channel_name(self.msg_data)
+
+    @lru_cache(maxsize=512)
+    def _parse_channel_name(self, msg_data: bytes) -> list[dict[str, any]]:
+        ch_number, ch_name_array = msg_data[0], msg_data[1:]
+        ch_name_str = ch_name_array.decode("ascii", errors="replace").rstrip('\x00')
+        return [{
             "result_type": "channel_name",
-            "channel": self.template_data.channel_definitions.get(ch_number, "Unknown"),
+            "channel": self.template_data.channel_definitions_table[ch_number] or "Unknown",
             "data": ch_name_str
         }]
 
@@ -103,6 +133,6 @@ class SysExHandler:
         mmc_action = self.msg_data[2]
         self.result = [{
             "result_type": "mmc_action",
-            "action": self.template_data.mmc_commands.get(mmc_action, "Unknown"),
+            "action": self.template_data.mmc_commands_table[mmc_action] or "Unknown",
             "data": None
         }]
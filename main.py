@@ -1,18 +1,35 @@
-import asyncio
+import signal
 import sys
 import threading
 import traceback
-from collections import deque
 
-from jinja2 import Template
 from logbook import Logger, StreamHandler
 from logbook.more import JinjaFormatter
-from helpers.hex import hexify
 from helpers.data import AppConfiguration, MessageTemplates
 from helpers.osc import OSCClient
 from helpers.mdns import ZeroConfService
 from helpers.midi import MIDIInterface, MIDIProcessor
 
+# OSC path formats per handler result type; plain str.format placeholders
+# filled from the result dict, no template engine involved
+_OSC_PATH_FORMATS = {
+    "channel_name": "/qu/channel/{channel}/name",
+    "channel_fader": "/qu/channel/{channel}/fader",
+    "channel_pan": "/qu/channel/{channel}/pan/{mix}",
+    "ch_preamp_source": "/qu/channel/{channel}/preamp-source",
+    "ch_usb_source": "/qu/channel/{channel}/usb-source",
+    "pafl_select": "/qu/channel/{channel}/pafl-select",
+    "console_fwversion": "/qu/console/fw-version",
+    "console_type": "/qu/console/type",
+    "function": "/qu/function/{function}",
+    "mmc_action": "/qu/mmc/{action}"
+}
+
+# Upper bound on buffered MIDI bytes (matches the old deque maxlen); no
+# valid message gets near this, so hitting it means the stream desynced
+# and the buffer is discarded to resync
+_MSG_STORE_LIMIT = 15000
+
 
 class AHMIDIProcessor:
     def __init__(self):
@@ -21,7 +38,17 @@ class AHMIDIProcessor:
         self.app_config = AppConfiguration(logger=self.logger)
         self.templates = MessageTemplates(logger=self.logger)
         self.set_logging_parameters()
-        self.msg_store = deque(maxlen=15000)
+        # Raw MIDI bytes accumulate here between callbacks; a bytearray
+        # stores one byte per element and is cleared in place, so the steady
+        # state allocates nothing
+        self.msg_store = bytearray()
+        self.processor = MIDIProcessor(self.logger, self.templates)
+        # MMC commands are a small static set, so their OSC paths are
+        # formatted once here instead of per event in map_to_osc
+        self._mmc_paths = {
+            action: _OSC_PATH_FORMATS["mmc_action"].format(action=action)
+            for action in [*self.templates.mmc_commands.values(), "Unknown"]
+        }
 
         self.exit_event = threading.Event()
         self.midi_ok = self.setup_midi_communications()
@@ -29,7 +56,7 @@ class AHMIDIProcessor:
         self.mdns_ok = self.setup_service_registration()
         if self.midi_ok and self.osc_ok and self.mdns_ok:
             self.logger.info("Initialization complete, entering ready state. Press Control-C to exit")
-            asyncio.run(self.keep_alive())  # Runs the event loop
+            self.keep_alive()
         else:
             self.logger.error("Initialization failed, cannot enter ready state. Exiting...")
             self.cleanup()
@@ -65,13 +92,14 @@ class AHMIDIProcessor:
     def setup_midi_communications(self) -> bool:
         self.logger.info("Setting up MIDI Communication...")
         try:
-            self.midi_in = MIDIInterface(
+            self.midi_interface = MIDIInterface(
                 app_logger=self.logger,
                 input_name=self.app_config.midi_options.get("control_port_name"),
                 queue_size_limit=self.app_config.midi_options.get("queue_size_limit"),
-                sysex_disable=False
-            ).midi_instance
-            self.midi_in.set_callback(self.midi_callback)
+                sysex_disable=False,
+                on_message=self.midi_callback
+            )
+            self.midi_in = self.midi_interface.midi_instance
             return True
         except Exception as e:
             self.logger.error(f"Failed to setup MIDI Communication -> {e}")
@@ -95,17 +123,21 @@ class AHMIDIProcessor:
             self.logger.error(f"Failed to register application for service discovery -> {e}")
             return False
 
-    async def keep_alive(self) -> None:
+    def keep_alive(self) -> None:
+        # Parks the main thread with zero wakeups until shutdown is
+        # signalled; SIGINT sets the event directly instead of raising
+        # KeyboardInterrupt, so the wait returns without any polling
+        signal.signal(signal.SIGINT, self.handle_interrupt)
         try:
-            while not self.exit_event.is_set():
-                await asyncio.sleep(0.1)  # Prevents blocking execution
-        except asyncio.CancelledError:
-            print("\b\b", end="")
-            self.exit_event.set()
-            self.logger.info("Keyboard interrupt received. Exiting...")
+            self.exit_event.wait()
         finally:
             self.cleanup()
 
+    def handle_interrupt(self, signum, frame) -> None:
+        print("\b\b", end="")
+        self.logger.info("Keyboard interrupt received. Exiting...")
+        self.exit_event.set()
+
     def cleanup(self) -> None:
         """Handles cleanup before exiting."""
         self.logger.info("Cleaning up resources...")
@@ -114,86 +146,93 @@ class AHMIDIProcessor:
             self.midi_in.delete()
         if hasattr(self, "mdns_service"):
             self.mdns_service.exit_event.set()
+        if hasattr(self, "osc_client"):
+            self.osc_client.close()
 
     def midi_callback(self, message: tuple, data) -> None:
+        # msg_bytes is already a list of raw ints from rtmidi
         msg_bytes, _ = message
-        msg_bytes = hexify(msg_bytes)
-        self.msg_store.extend(msg_bytes)
-        preserve_store = True
-        
-        # print(self.msg_store)
-        
+        # Bind the hot attributes once; every self.<attr> in here is an
+        # MRO lookup paid per MIDI event
+        store = self.msg_store
+        dispatch = self.dispatch_message
+
         try:
-            if not self.is_complete_midi_message(self.msg_store):
+            # rtmidi delivers most messages whole in a single callback; only
+            # fragmented SysEx and multi-part NRPN runs need the accumulation
+            # buffer, so dispatch complete messages directly without it
+            if not store:
+                if msg_bytes[0] == 0xF0:
+                    if msg_bytes[-1] == 0xF7:
+                        dispatch(msg_bytes)
+                        return
+                elif len(msg_bytes) == self.get_expected_length(msg_bytes):
+                    dispatch(msg_bytes)
+                    return
+
+            store.extend(msg_bytes)
+            if not self.is_complete_midi_message(store):
+                if len(store) > _MSG_STORE_LIMIT:
+                    self.logger.warning(f"Message store exceeded {_MSG_STORE_LIMIT} bytes without completing; discarding buffered data to resync")
+                    store.clear()
                 return
-            
-            processor = MIDIProcessor(
-                self.logger,
-                message=self.msg_store,
-                data=data,
-                templates=self.templates
-            )
-            preserve_store = False
-
-            self.logger.info(f"Result: {processor.result}")
-            if isinstance(processor.result, list):
-                for item in processor.result:
-                    self.map_to_osc(item)
-            else:
-                self.logger.error("The handler result attribute must be a list of dictionaries, OSC cannot be sent")
-            
-            if not preserve_store:
-                self.msg_store.clear()
+            dispatch(store)
+            store.clear()
         except Exception:
             self.logger.error("An exception was raised in the callback function.")
             traceback.print_exc()
 
-    def is_complete_midi_message(self, message: deque[str]) -> bool:
-        """Determines the expected length of a MIDI message."""
+    def dispatch_message(self, message) -> None:
+        """Run one complete MIDI message through the processor and send OSC."""
+        result = self.processor.process(message)
+
+        self.logger.info(f"Result: {result}")
+        if isinstance(result, list):
+            # Collect every OSC message this MIDI event produced and hand
+            # them to the client as one batch, so multi-result handlers
+            # (e.g. console info) cost a single send
+            messages = [msg for msg in map(self.map_to_osc, result) if msg is not None]
+            if messages:
+                self.osc_client.send_many(messages)
+        else:
+            self.logger.error("The handler result attribute must be a list of dictionaries, OSC cannot be sent")
+
+    def is_complete_midi_message(self, message: bytearray) -> bool:
+        """Determines whether a complete MIDI message has accumulated."""
         if not message:
             return None
-        if message[0] == "0xf0":
-            # print(message[0])
-            if message[-1] == "0xf7":
+        if message[0] == 0xF0:
+            if message[-1] == 0xF7:
                 return True
             return False
         expected_length = self.get_expected_length(message)
         if len(message) == expected_length:
             return True
         return False
-    
-    def get_expected_length(self, message: deque[str]) -> int | None:
+
+    def get_expected_length(self, message: bytearray) -> int | None:
         """Determines the expected length of a MIDI message."""
         if not message:
             return None
 
-        message_type = message[0][2]
-        length_info = self.templates.message_types.get(message_type, {}).get("length")
-        if isinstance(length_info, int):
-            return length_info
-        length_info = self.templates.message_types[message_type]["subtype"].get(message[1][2:])
-        if isinstance(length_info, int):
-            return length_info
+        status = message[0]
+        length = self.templates.length_table[status]
+        if length > 0:
+            return length
+        if length < 0:
+            # Length is keyed on the controller byte for this message type
+            return self.templates.subtype_lengths.get((status >> 4, message[1]))
         return None
     
-    def map_to_osc(self, result) -> None:
+    def map_to_osc(self, result) -> tuple[str, any] | None:
+        """Map one handler result to an OSC (path, value) pair, or None."""
         result_type = result.get("result_type", "")
-        osc_path_templates = {
-            "channel_name": "/qu/channel/{{channel}}/name",
-            "channel_fader": "/qu/channel/{{channel}}/fader",
-            "channel_pan": "/qu/channel/{{channel}}/pan/{{mix}}",
-            "ch_preamp_source": "/qu/channel/{{channel}}/preamp-source",
-            "ch_usb_source": "/qu/channel/{{channel}}/usb-source",
-            "pafl_select": "/qu/channel/{{channel}}/pafl-select",
-            "console_fwversion": "/qu/console/fw-version",
-            "console_type": "/qu/console/type",
-            "function": "/qu/function/{{function}}",
-            "mmc_action": "/qu/mmc/{{action}}"
-        }
-        if result_type in osc_path_templates:
-            template = Template(osc_path_templates[result_type])
-            osc_path = template.render(result)
-            self.osc_client.send(osc_path, value=result["data"])
+        if result_type == "mmc_action":
+            return self._mmc_paths[result["action"]], result["data"]
+        path_format = _OSC_PATH_FORMATS.get(result_type)
+        if path_format is not None:
+            return path_format.format_map(result), result["data"]
+        return None
 
 
 if __name__ == "__main__":